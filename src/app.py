@@ -8,11 +8,12 @@ Contains the main application class that drives the Touch Companion system.
 import time
 import asyncio
 import logging
-import json  # Added for state persistence
+import os
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Dict, Optional, Union
 
+import orjson
 import uvicorn
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
@@ -23,13 +24,14 @@ from src.touch_tracker import TouchTracker
 from src.state_manager import StateManager
 from src.camera_manager import CameraManager
 from src.web import routes as web_routes
-from src.web.routes import broadcast_stats, broadcast_api_response
+from src.web.routes import broadcast_stats, broadcast_api_response, stats_broadcaster
 
 # Configure logger
 logger = logging.getLogger("touch_companion")
 
 # Define state file path (adjust as needed)
 STATE_FILE = Path(__file__).parent.parent / "data" / "app_state.json"
+STATE_SAVE_INTERVAL_SEC = 60
 
 
 class TouchCompanionApp:
@@ -47,7 +49,14 @@ class TouchCompanionApp:
         self.manager: Optional[StateManager] = None
         self.camera_manager: Optional[CameraManager] = None
         self.background_task_running = False
+        self._sensor_task: Optional[asyncio.Task] = None
+        self._broadcast_task: Optional[asyncio.Task] = None
+        self.touch_irq = None  # Optional TouchIrq, set up in _lifespan
+        self._touch_irq_event = asyncio.Event()
         self._state_file_path = STATE_FILE  # Store state file path
+        self._last_state_save = time.monotonic()
+        self._last_saved_state: Optional[Dict] = None
+        self._pending_save: Optional[asyncio.Future] = None  # In-flight state write
 
         # Setup logging configuration
         self._setup_logging()
@@ -106,6 +115,11 @@ class TouchCompanionApp:
         logger.info("Starting Touch Companion application")
         self.background_task_running = True
         try:
+            # Run new tasks eagerly so ones that finish without suspending
+            # skip a trip through the scheduler (Python 3.12+)
+            if hasattr(asyncio, "eager_task_factory"):
+                asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
             # Ensure data directory exists for state file
             self._state_file_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -131,6 +145,27 @@ class TouchCompanionApp:
             )
             logger.info("Touch tracker initialized")
 
+            # Wake the sensor loop on the MPR121 IRQ line if one is configured
+            if self.config.irq_gpio is not None and self.tracker.sensor:
+                try:
+                    from src.hardware.touch_irq import TouchIrq
+
+                    self.touch_irq = TouchIrq(
+                        self.config.irq_gpio, chip_path=self.config.irq_gpio_chip
+                    )
+                    self.touch_irq.start(self._touch_irq_event.set)
+                    logger.info(
+                        f"Touch IRQ enabled on {self.config.irq_gpio_chip} line {self.config.irq_gpio}"
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Error initializing touch IRQ, falling back to polling: {e}"
+                    )
+                    if self.touch_irq:
+                        # The line was requested but watching it failed; release it
+                        self.touch_irq.close()
+                    self.touch_irq = None
+
             # Initialize State Manager if LEDs are available
             if self.leds:
                 self.manager = StateManager(
@@ -170,8 +205,13 @@ class TouchCompanionApp:
             # Load previous state if available
             self._load_state()
 
-            # Start the background task
-            asyncio.create_task(self._sensor_monitor_task())
+            # Start the background tasks (keep references so they aren't garbage collected)
+            self._broadcast_task = asyncio.create_task(
+                stats_broadcaster(), name="stats_broadcaster"
+            )
+            self._sensor_task = asyncio.create_task(
+                self._sensor_monitor_task(), name="sensor_monitor"
+            )
 
         except ImportError as e:
             logger.error(f"Import error during startup: {e}")
@@ -186,11 +226,25 @@ class TouchCompanionApp:
         # Shutdown logic
         logger.info("Application shutting down")
         self.background_task_running = False
-        # Give the task a moment to finish gracefully
-        await asyncio.sleep(self.config.update_interval_sec * 2)
+        # Stop the background tasks and wait until they have actually exited,
+        # so no new state updates or color changes start after this point
+        tasks = [task for task in (self._sensor_task, self._broadcast_task) if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("Background tasks stopped")
+        if self.manager:
+            # Stop any fade still running so it can't relight the strip after clear()
+            await self.manager.stop()
+        if self.touch_irq:
+            self.touch_irq.close()
         if self.leds:
             self.leds.clear()  # Turn off LEDs on exit
             logger.info("LED strip cleared")
+        # Let a periodic save still running in the executor finish first,
+        # so the final save doesn't race it for the state file
+        if self._pending_save:
+            await asyncio.gather(self._pending_save, return_exceptions=True)
         # Save state on shutdown
         self._save_state()
 
@@ -209,44 +263,77 @@ class TouchCompanionApp:
 
     async def _sensor_monitor_task(self) -> None:
         """Run the core sensor reading and state update logic in the background."""
+        # Components are created before this task starts and never replaced,
+        # so resolve them once instead of on every cycle
+        tracker = self.tracker
+        manager = self.manager
+        if not (tracker and manager):
+            logger.warning(
+                "Sensor monitoring task not started (tracker or state manager missing)"
+            )
+            return
+
         logger.info("Sensor monitoring task started")
         while self.background_task_running:
             try:
-                if self.tracker and self.manager:
-                    # 1. Update touch sensor readings and timestamp history
-                    await self.tracker.update()
-
-                    # 2. Get the relevant touch count
-                    touch_count = self.tracker.get_touch_count_last_hour()
-
-                    # 3. Update the state (sad/glad) based on the count
-                    self.manager.update_state(touch_count)
-
-                    # 4. Prepare stats for broadcasting
-                    stats: Dict[str, Union[bool, int]] = {
-                        "is_glad": self.manager.is_glad,
-                        "touch_count_last_hour": touch_count,
-                        "touch_threshold": self.manager.touch_threshold,
-                        "total_touches": self.tracker.get_total_touches(),
-                        "today_touches": self.tracker.get_today_touches(),
-                    }
-                    # 5. Broadcast stats via WebSocket
-                    await broadcast_stats(stats)
-
-                    # 6. Save current state periodically (every minute)
-                    if int(time.time()) % 60 == 0:
-                        self._save_state()
+                # 1. Update touch sensor readings and timestamp history
+                await tracker.update()
+
+                # 2. Get the relevant touch count
+                touch_count = tracker.get_touch_count_last_hour()
+
+                # 3. Update the state (sad/glad) based on the count
+                manager.update_state(touch_count)
+
+                # 4. Prepare stats for broadcasting
+                stats: Dict[str, Union[bool, int]] = {
+                    "is_glad": manager.is_glad,
+                    "touch_count_last_hour": touch_count,
+                    "touch_threshold": manager.touch_threshold,
+                    "total_touches": tracker.get_total_touches(),
+                    "today_touches": tracker.get_today_touches(),
+                }
+                # 5. Queue stats for the next WebSocket broadcast
+                broadcast_stats(stats)
+
+                # 6. Save current state periodically (once per interval)
+                now = time.monotonic()
+                if now - self._last_state_save >= STATE_SAVE_INTERVAL_SEC:
+                    self._last_state_save = now
+                    await self._save_state_async()
 
                 # Wait before next cycle
-                await asyncio.sleep(self.config.update_interval_sec)
+                await self._wait_for_next_cycle()
             except Exception as e:
                 logger.error(f"Error in sensor monitoring task: {e}")
                 await asyncio.sleep(5)  # Wait before retrying after an error
 
         logger.info("Sensor monitoring task stopped")
 
-    def _save_state(self) -> None:
-        """Save the current application state to a file."""
+    async def _wait_for_next_cycle(self) -> None:
+        """Wait until the sensor should be read again.
+
+        With an IRQ line this waits for the next edge, falling back to a slow
+        timer so a missed edge and the hourly count decay are still picked up.
+        Without one it simply sleeps for the polling interval.
+        """
+        if not self.touch_irq:
+            await asyncio.sleep(self.config.update_interval_sec)
+            return
+
+        try:
+            async with asyncio.timeout(self.config.irq_fallback_interval_sec):
+                await self._touch_irq_event.wait()
+        except TimeoutError:
+            pass
+        self._touch_irq_event.clear()
+
+    def _collect_state(self) -> Optional[Dict]:
+        """Gather the persistable state of all components.
+
+        Returns:
+            The state dictionary, or None if a component is not ready yet
+        """
         try:
             state_data = {}
 
@@ -259,19 +346,63 @@ class TouchCompanionApp:
             if self.camera_manager:
                 state_data["camera"] = self.camera_manager.get_state()
 
-            with open(self._state_file_path, "w") as f:
-                json.dump(state_data, f, indent=4)
-            logger.debug(f"Application state saved to {self._state_file_path}")
+            return state_data
         except AttributeError as e:
             logger.warning(
                 f"Could not get state from components (might still be initializing): {e}"
             )
+        except Exception as e:
+            logger.error(f"Unexpected error collecting state: {e}", exc_info=True)
+        return None
+
+    def _write_state(self, state_data: Dict) -> bool:
+        """Write collected state to the state file.
+
+        Args:
+            state_data: The state dictionary returned by _collect_state
+
+        Returns:
+            True if the state was written successfully
+        """
+        try:
+            # Write a temp file and swap it in, so a crash or overlapping write
+            # can never leave a truncated or mixed-up state file behind
+            state_path = self._state_file_path
+            tmp_path = state_path.with_name(state_path.name + ".tmp")
+            tmp_path.write_bytes(orjson.dumps(state_data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, state_path)
+            logger.debug(f"Application state saved to {state_path}")
+            return True
         except IOError as e:
             logger.error(
                 f"Failed to save application state to {self._state_file_path}: {e}"
             )
         except Exception as e:
             logger.error(f"Unexpected error saving state: {e}", exc_info=True)
+        return False
+
+    def _save_state(self) -> None:
+        """Save the current application state to a file."""
+        state_data = self._collect_state()
+        if state_data is not None and self._write_state(state_data):
+            self._last_saved_state = state_data
+
+    async def _save_state_async(self) -> None:
+        """Save the current application state without blocking the event loop.
+
+        The state is collected on the loop so it is consistent, and only the
+        file write runs in the default executor. Nothing is written if the
+        state is unchanged since the last save.
+        """
+        state_data = self._collect_state()
+        if state_data is None or state_data == self._last_saved_state:
+            return
+        loop = asyncio.get_running_loop()
+        self._pending_save = loop.run_in_executor(None, self._write_state, state_data)
+        # Shield the write so cancelling the sensor task on shutdown leaves it
+        # to finish; shutdown awaits it before writing the final state
+        if await asyncio.shield(self._pending_save):
+            self._last_saved_state = state_data
 
     def _load_state(self) -> None:
         """Load application state from a file if it exists."""
@@ -280,8 +411,7 @@ class TouchCompanionApp:
             return
 
         try:
-            with open(self._state_file_path, "r") as f:
-                state_data = json.load(f)
+            state_data = orjson.loads(self._state_file_path.read_bytes())
 
             if "tracker" in state_data and self.tracker:
                 self.tracker.load_state(state_data["tracker"])
@@ -299,7 +429,7 @@ class TouchCompanionApp:
                 f"Application state successfully loaded from {self._state_file_path}"
             )
 
-        except (IOError, json.JSONDecodeError) as e:
+        except (IOError, orjson.JSONDecodeError) as e:
             logger.error(
                 f"Failed to load application state from {self._state_file_path}: {e}"
             )
@@ -316,4 +446,12 @@ class TouchCompanionApp:
             host=self.config.host,
             port=self.config.port,
             log_level=self.config.log_level,
+            loop="uvloop",
+            http="httptools",
+            ws="websockets",
+            ws_per_message_deflate=True,  # Stats JSON compresses well
+            # Protocol-level heartbeat so dead clients are dropped, not broadcast to
+            ws_ping_interval=self.config.ws_ping_interval_sec,
+            ws_ping_timeout=self.config.ws_ping_timeout_sec,
+            access_log=False,  # Per-request logging is pure overhead here
         )
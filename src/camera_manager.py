@@ -41,6 +41,7 @@ class CameraManager:
         self.min_interval_sec = min_interval_sec
         self.response_display_time = response_display_time
         self.last_capture_time: float = 0.0
+        self._capture_task: Optional[asyncio.Task] = None
         self.latest_response: Optional[Dict[str, Any]] = None
         self._response_callback: Optional[
             Callable[[Dict[str, Any]], Awaitable[None]]
@@ -96,9 +97,13 @@ class CameraManager:
         if current_time - self.last_capture_time < self.min_interval_sec:
             return False
 
+        # Only one capture/API round-trip at a time; touches during it collapse
+        if self._capture_task and not self._capture_task.done():
+            return False
+
         self.last_capture_time = current_time
 
-        asyncio.create_task(self._capture_and_process())
+        self._capture_task = asyncio.create_task(self._capture_and_process())
         return True
 
     async def _capture_and_process(self):
@@ -108,10 +113,9 @@ class CameraManager:
             return
 
         try:
-            with tempfile.NamedTemporaryFile(suffix=".jpg", delete=True) as tmp_file:
-                self.camera.take_photo(tmp_file.name)
-                tmp_file.seek(0)
-                binary_jpeg_data = tmp_file.read()
+            # Capturing and reading the photo blocks, so keep it off the event loop
+            loop = asyncio.get_running_loop()
+            binary_jpeg_data = await loop.run_in_executor(None, self._capture_jpeg)
 
             logger.debug("Image captured, sending to API...")
             await self._send_to_api(binary_jpeg_data)
@@ -121,6 +125,13 @@ class CameraManager:
                 f"Error during image capture or processing: {e}", exc_info=True
             )
 
+    def _capture_jpeg(self) -> bytes:
+        """Take a photo and return it as JPEG bytes (blocking)."""
+        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=True) as tmp_file:
+            self.camera.take_photo(tmp_file.name)
+            tmp_file.seek(0)
+            return tmp_file.read()
+
     async def _send_fallback_compliment(self, error_context: str = ""):
         """Send a fallback compliment when API request fails.
 
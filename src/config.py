@@ -22,6 +22,17 @@ class AppConfig(BaseModel):
     history_duration_sec: int = Field(
         default=3600, description="Duration in seconds to keep touch history"
     )
+    irq_gpio: Optional[int] = Field(
+        default=None,
+        description="GPIO line wired to the MPR121 IRQ pin (polls if unset)",
+    )
+    irq_gpio_chip: str = Field(
+        default="/dev/gpiochip0", description="GPIO chip device for the IRQ line"
+    )
+    irq_fallback_interval_sec: float = Field(
+        default=1.0,
+        description="Interval in seconds between sensor checks when no IRQ fires",
+    )
 
     # LED Strip Config
     led_device: str = Field(
@@ -52,6 +63,13 @@ class AppConfig(BaseModel):
     # Server Config
     host: str = Field(default="0.0.0.0", description="Host interface to bind server to")
     port: int = Field(default=8000, description="Port to run server on")
+    ws_ping_interval_sec: float = Field(
+        default=15.0, description="Interval in seconds between WebSocket pings"
+    )
+    ws_ping_timeout_sec: float = Field(
+        default=30.0,
+        description="Seconds to wait for a pong before dropping a WebSocket client",
+    )
 
     # Logging Config
     log_level: str = Field(default="info", description="Logging level")
@@ -94,6 +112,12 @@ def parse_arguments() -> AppConfig:
         help="Duration in seconds to keep touch history (default: 1 hour)",
     )
 
+    parser.add_argument(
+        "--irq-gpio",
+        type=int,
+        help="GPIO line wired to the MPR121 IRQ pin (polls if unset)",
+    )
+
     # LED Strip Config
     parser.add_argument("--num-leds", type=int, help="Number of LEDs in the strip")
 
@@ -125,6 +149,9 @@ def parse_arguments() -> AppConfig:
     if args.history_duration is not None:
         config_dict["history_duration_sec"] = args.history_duration
 
+    if args.irq_gpio is not None:
+        config_dict["irq_gpio"] = args.irq_gpio
+
     if args.num_leds is not None:
         config_dict["num_leds"] = args.num_leds
 
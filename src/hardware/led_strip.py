@@ -2,6 +2,7 @@ import asyncio
 import time
 import random
 import math
+from concurrent.futures import ThreadPoolExecutor
 from pi5neo import Pi5Neo
 
 
@@ -11,6 +12,14 @@ class LedStrip:
         self.current_color = (0, 0, 0)  # Default color is off
         self.steps = 100  # Default steps for transitions
         self._shimmer_active = False
+        # SPI writes block, so they run on one dedicated thread; a single worker
+        # also keeps writes from overlapping fades in order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="led_strip")
+
+    def _show_color(self, color):
+        """Fills the whole strip with a color and pushes it out (blocking)."""
+        self.neo.fill_strip(*color)
+        self.neo.update_strip()
 
     async def change_color(self, color, steps=None):
         """Fades LED strip from current color to new color (asynchronously)
@@ -26,17 +35,17 @@ class LedStrip:
         else:
             self.steps = steps
 
+        loop = asyncio.get_running_loop()
+        start_color = self.current_color
         for step in range(steps):
-            for led in range(self.neo.num_leds):
-                transition_color = tuple(
-                    int(
-                        self.current_color[c]
-                        + ((color[c] - self.current_color[c]) * (step / steps))
-                    )
-                    for c in range(3)
-                )
-                self.neo.set_led_color(led, *transition_color)
-            self.neo.update_strip()
+            # Every LED gets the same color, so compute it once and fill the strip
+            transition_color = tuple(
+                int(start_color[c] + ((color[c] - start_color[c]) * (step / steps)))
+                for c in range(3)
+            )
+            await loop.run_in_executor(self._executor, self._show_color, transition_color)
+            # Track the shown color so a fade cancelled midway hands over smoothly
+            self.current_color = transition_color
             await asyncio.sleep(0.01)  # Use asyncio.sleep
 
         self.current_color = color
@@ -96,6 +105,6 @@ class LedStrip:
     def clear(self):
         """Clears the LED strip"""
         self._shimmer_active = False
-        self.neo.fill_strip(0, 0, 0)
-        self.neo.update_strip()
+        # Go through the LED thread so this can't interleave with a fade step
+        self._executor.submit(self._show_color, (0, 0, 0)).result()
         self.current_color = (0, 0, 0)
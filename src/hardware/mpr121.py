@@ -29,6 +29,7 @@ class MPR121TouchSensor:
             [] for _ in range(12)
         ]  # List of durations for each electrode
         self.current_touches = [False] * 12  # Current touch status
+        self._touch_mask = 0  # Current touch status as a bitmask
 
         # Initialize the sensor
         self._initialize_sensor()
@@ -67,19 +68,27 @@ class MPR121TouchSensor:
             self.i2c_address, self.ELECTRODE_CONFIG_REG, 0x8F
         )  # Enable electrodes
 
-    def read_touch_status(self):
-        """Read the current touch status from the MPR121.
+    def read_touch_mask(self):
+        """Read the current touch status from the MPR121 as a bitmask.
 
         Returns:
-            A 12-element list of boolean values indicating touch status for each electrode.
+            An int where bit i is set if electrode i is touched (12 bits used).
         """
         # Read the touch status registers (2 bytes)
         touch_status = self.bus.read_i2c_block_data(
             self.i2c_address, self.TOUCH_STATUS_REG, 2
         )
 
-        # Convert to a 16-bit value (though only the first 12 bits are used)
-        touch_value = touch_status[0] | (touch_status[1] << 8)
+        # Convert to a 16-bit value and keep only the 12 electrode bits
+        return (touch_status[0] | (touch_status[1] << 8)) & 0x0FFF
+
+    def read_touch_status(self):
+        """Read the current touch status from the MPR121.
+
+        Returns:
+            A 12-element list of boolean values indicating touch status for each electrode.
+        """
+        touch_value = self.read_touch_mask()
 
         # Extract individual electrode statuses (1 = touched, 0 = not touched)
         touch_status_list = [(touch_value >> i) & 1 == 1 for i in range(12)]
@@ -88,24 +97,31 @@ class MPR121TouchSensor:
 
     def update(self):
         """Update touch status and track touches and durations."""
-        current_status = self.read_touch_status()
+        current_mask = self.read_touch_mask()
+        if current_mask == self._touch_mask:
+            return  # Nothing changed since the last update
+
         current_time = time.time()
 
-        for i in range(12):
-            # If electrode was not touched and now is touched (touch start)
-            if not self.current_touches[i] and current_status[i]:
-                self.current_touches[i] = True
-                self.touch_count[i] += 1
-                self.touch_start_times[i] = current_time
-
-            # If electrode was touched and now is not touched (touch end)
-            elif self.current_touches[i] and not current_status[i]:
-                self.current_touches[i] = False
-                duration = current_time - self.touch_start_times[i]
-                self.touch_durations[i].append(duration)
+        # Electrodes that were not touched and now are (touch start)
+        rising = current_mask & ~self._touch_mask
+        while rising:
+            i = (rising & -rising).bit_length() - 1
+            rising &= rising - 1
+            self.touch_count[i] += 1
+            self.touch_start_times[i] = current_time
+
+        # Electrodes that were touched and now are not (touch end)
+        falling = self._touch_mask & ~current_mask
+        while falling:
+            i = (falling & -falling).bit_length() - 1
+            falling &= falling - 1
+            duration = current_time - self.touch_start_times[i]
+            self.touch_durations[i].append(duration)
 
         # Update the current touch status
-        self.current_touches = current_status
+        self._touch_mask = current_mask
+        self.current_touches = [(current_mask >> i) & 1 == 1 for i in range(12)]
 
     def get_touch_count(self, electrode=None):
         """Get the number of touches for a specific electrode or all electrodes.
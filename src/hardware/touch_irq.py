@@ -0,0 +1,52 @@
+import asyncio
+from typing import Callable, Optional
+
+import gpiod
+from gpiod.line import Bias, Edge
+
+
+class TouchIrq:
+    # The MPR121 IRQ output is open-drain and pulled low on any status change
+    CONSUMER = "touch-companion"
+
+    def __init__(self, line, chip_path="/dev/gpiochip0"):
+        """Request the GPIO line wired to the MPR121 IRQ pin.
+
+        Args:
+            line: The GPIO line offset the IRQ pin is connected to
+            chip_path: The GPIO chip device path (default: /dev/gpiochip0)
+        """
+        self.line = line
+        self.chip_path = chip_path
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._request = gpiod.request_lines(
+            chip_path,
+            consumer=self.CONSUMER,
+            config={
+                line: gpiod.LineSettings(
+                    edge_detection=Edge.FALLING, bias=Bias.PULL_UP
+                )
+            },
+        )
+
+    def start(self, callback: Callable[[], None]):
+        """Watch the IRQ line on the running event loop.
+
+        Args:
+            callback: Called on the event loop after each falling edge
+        """
+        loop = asyncio.get_running_loop()
+        loop.add_reader(self._request.fd, self._on_ready, callback)
+        self._loop = loop
+
+    def _on_ready(self, callback: Callable[[], None]):
+        """Drain pending edge events and notify the callback."""
+        self._request.read_edge_events()
+        callback()
+
+    def close(self):
+        """Stop watching the IRQ line and release it."""
+        if self._loop is not None:
+            self._loop.remove_reader(self._request.fd)
+            self._loop = None
+        self._request.release()
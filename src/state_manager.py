@@ -6,7 +6,7 @@ Manages the sad/glad state based on touch counts and controls the LED strip.
 """
 
 import asyncio
-from typing import Tuple, Dict
+from typing import Set, Tuple, Dict
 import logging
 
 from src.hardware.led_strip import LedStrip
@@ -40,6 +40,7 @@ class StateManager:
         self.glad_color = glad_color
         self.transition_steps = transition_steps
         self.is_glad = False  # Start in the sad state
+        self._color_tasks: Set[asyncio.Task] = set()  # Running LED color changes
         self._initialize_leds()
 
     def _initialize_leds(self) -> None:
@@ -50,6 +51,37 @@ class StateManager:
         self.led_strip.neo.update_strip()
         self.led_strip.current_color = self.sad_color
 
+    def _start_color_change(self, color: Tuple[int, int, int]) -> None:
+        """Run an LED color transition in the background.
+
+        Args:
+            color: Target RGB color tuple
+        """
+        # A newer target supersedes any fade still in progress
+        self._cancel_color_changes()
+        task = asyncio.create_task(
+            self.led_strip.change_color(color, steps=self.transition_steps)
+        )
+        self._color_tasks.add(task)
+        task.add_done_callback(self._on_color_change_done)
+
+    def _on_color_change_done(self, task: asyncio.Task) -> None:
+        """Forget a finished color transition and log any error it raised."""
+        self._color_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error changing LED color: {task.exception()}")
+
+    def _cancel_color_changes(self) -> None:
+        """Cancel all running color transitions."""
+        for task in self._color_tasks:
+            task.cancel()
+
+    async def stop(self) -> None:
+        """Cancel running color transitions and wait until they have exited."""
+        tasks = list(self._color_tasks)
+        self._cancel_color_changes()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     def update_state(self, touch_count_last_hour: int) -> None:
         """Update the state based on the touch count.
 
@@ -63,14 +95,14 @@ class StateManager:
                 f"Touch threshold ({self.touch_threshold}) reached. Changing to GLAD state"
             )
             # Run color change in the background
-            asyncio.create_task(self.led_strip.change_color(self.glad_color, steps=self.transition_steps))
+            self._start_color_change(self.glad_color)
             self.is_glad = True
         elif not should_be_glad and self.is_glad:
             logger.info(
                 f"Touch count ({touch_count_last_hour}) below threshold. Changing back to SAD state"
             )
             # Run color change in the background
-            asyncio.create_task(self.led_strip.change_color(self.sad_color, steps=self.transition_steps))
+            self._start_color_change(self.sad_color)
             self.is_glad = False
 
     def get_state(self) -> Dict:
@@ -147,7 +179,7 @@ class StateManager:
             current_target_color = self.glad_color if self.is_glad else self.sad_color
             logger.info(f"Re-applying current state color: {current_target_color}")
             # Run color change in the background
-            asyncio.create_task(self.led_strip.change_color(current_target_color, steps=self.transition_steps))
+            self._start_color_change(current_target_color)
 
 
 # Example Usage (requires LedStrip instance)
@@ -5,11 +5,12 @@ Touch Tracker Module.
 Tracks touch events from the MPR121 sensor and stores timestamps for historical analysis.
 """
 
+import asyncio
 import logging
 import time
 from collections import deque
 from datetime import date  # Added datetime for state serialization
-from typing import Deque, Dict, List, Optional, Callable, Awaitable
+from typing import Deque, Dict, Optional, Callable, Awaitable
 
 from src.hardware.mpr121 import MPR121TouchSensor
 
@@ -35,14 +36,19 @@ class TouchTracker:
         """
         self.sensor: Optional[MPR121TouchSensor] = None
         self.history_duration = history_duration_sec
+        # Monotonic timestamps, immune to wall-clock jumps (NTP, date -s)
         self.touch_timestamps: Deque[float] = deque()
-        self._last_touch_status: List[bool] = [False] * 12
+        self._last_touch_status: int = 0  # Bitmask, bit i = electrode i touched
 
         # Track total touches and daily touches
         self.total_touches: int = 0
         self.daily_touches: Dict[date, int] = {}
         self._current_date: date = date.today()
 
+        # Cached get_state() result, rebuilt only after the state changes
+        self._state_cache: Optional[Dict] = None
+        self._state_dirty: bool = True
+
         # Callback for touch events, to be set by camera integration
         self._touch_callback: Optional[Callable[[], Awaitable[None]]] = None
 
@@ -66,42 +72,68 @@ class TouchTracker:
 
     async def update(self) -> None:
         """Read the sensor and record timestamps for new touch events."""
+        today = date.today()
+
+        # Check if date has changed - if so, update the current date and
+        # drop daily counts that fell out of the retention window. This runs
+        # before the sensor checks so "today" still advances without readings
+        if today != self._current_date:
+            self._current_date = today
+            self._prune_daily_touches(today)
+            self._state_dirty = True
+
+        # Prune old timestamps, also before the sensor checks, so the hourly
+        # count still decays when there are no readings
+        self._prune_timestamps(time.monotonic())
+
         if not self.sensor:
             return  # Do nothing if sensor failed to initialize
 
         try:
-            current_status = self.sensor.read_touch_status()
+            # The I2C transaction blocks, so keep it off the event loop
+            loop = asyncio.get_running_loop()
+            current_status = await loop.run_in_executor(
+                None, self.sensor.read_touch_mask
+            )
         except Exception as e:
             logger.error(f"Error reading touch status: {e}")
             return  # Skip update if reading fails
 
-        current_time = time.time()
-        today = date.today()
-
-        # Check if date has changed - if so, update the current date
-        if today != self._current_date:
-            self._current_date = today
+        current_time = time.monotonic()
 
         # Initialize today's count if not present
-        if today not in self.daily_touches:
-            self.daily_touches[today] = 0
+        daily_touches = self.daily_touches
+        if today not in daily_touches:
+            daily_touches[today] = 0
+            self._state_dirty = True
+
+        # Any edge changes the counts or the persisted touch status
+        if current_status != self._last_touch_status:
+            self._state_dirty = True
+
+        # Electrodes that are touched now but were not touched on the last poll
+        rising = current_status & ~self._last_touch_status
 
-        touch_detected = False
-        for i in range(12):
-            # Detect a rising edge (touch start)
-            if current_status[i] and not self._last_touch_status[i]:
-                self.touch_timestamps.append(current_time)
+        touch_detected = rising != 0
+        timestamps = self.touch_timestamps
+        new_touches = 0
+        # Visit only the electrodes with a rising edge (touch start)
+        while rising:
+            i = (rising & -rising).bit_length() - 1
+            rising &= rising - 1
 
-                # Update touch counts
-                self.total_touches += 1
-                self.daily_touches[today] += 1
+            timestamps.append(current_time)
+            new_touches += 1
 
-                touch_detected = True
-                logger.debug(f"Touch detected on electrode {i}")
+            logger.debug("Touch detected on electrode %d", i)
 
         if touch_detected:
+            # Update touch counts
+            self.total_touches += new_touches
+            daily_touches[today] += new_touches
+
             logger.debug(
-                f"Total touches: {self.total_touches}, Today: {self.daily_touches[today]}"
+                "Total touches: %d, Today: %d", self.total_touches, daily_touches[today]
             )
 
             # Call touch callback if set
@@ -113,22 +145,27 @@ class TouchTracker:
 
         self._last_touch_status = current_status
 
-        # Prune old timestamps
-        self._prune_history(current_time)
-
-    def _prune_history(self, current_time: float) -> None:
-        """Remove timestamps older than the history duration.
+    def _prune_timestamps(self, current_time: float) -> None:
+        """Drop timestamps outside the history window.
 
         Args:
             current_time: The current timestamp to compare against
         """
-        while self.touch_timestamps and (
-            current_time - self.touch_timestamps[0] > self.history_duration
-        ):
-            self.touch_timestamps.popleft()
+        cutoff = current_time - self.history_duration
+        timestamps = self.touch_timestamps
+        if timestamps and timestamps[0] < cutoff:
+            self._state_dirty = True
+            while timestamps and timestamps[0] < cutoff:
+                timestamps.popleft()
 
-        # Also prune old daily counts (keep only the last 30 days)
-        today = date.today()
+    def _prune_daily_touches(self, today: date) -> None:
+        """Remove daily counts older than 30 days.
+
+        Only needed when the date changes, so this is not run on every poll.
+
+        Args:
+            today: The current date to compare against
+        """
         keys_to_remove = []
         for day in self.daily_touches.keys():
             if (today - day).days > 30:
@@ -136,16 +173,18 @@ class TouchTracker:
 
         for day in keys_to_remove:
             del self.daily_touches[day]
+        if keys_to_remove:
+            self._state_dirty = True
 
     def get_touch_count_last_hour(self) -> int:
         """Return the number of touches recorded within the history duration.
 
+        update() already prunes the history on every poll, so the count is at
+        most one update interval stale.
+
         Returns:
             The count of touch events within the history window
         """
-        # Ensure history is pruned before counting
-        current_time = time.time()
-        self._prune_history(current_time)
         return len(self.touch_timestamps)
 
     def get_total_touches(self) -> int:
@@ -159,25 +198,37 @@ class TouchTracker:
     def get_today_touches(self) -> int:
         """Return the number of touches recorded today.
 
+        Like get_touch_count_last_hour, this reuses the date from the last
+        update() rather than querying the clock again.
+
         Returns:
             The count of touch events for the current day
         """
-        today = date.today()
-        return self.daily_touches.get(today, 0)
+        return self.daily_touches.get(self._current_date, 0)
 
     def get_state(self) -> Dict:
-        """Return the current state of the tracker for persistence."""
+        """Return the current state of the tracker for persistence.
+
+        The result is cached and only rebuilt after the state has changed.
+        """
+        if not self._state_dirty and self._state_cache is not None:
+            return self._state_cache
+
         # Convert date keys to ISO format strings for JSON serialization
         serializable_daily_touches = {
             day.isoformat(): count for day, count in self.daily_touches.items()
         }
-        return {
+        # Monotonic time restarts on reboot, so persist wall-clock timestamps
+        wall_offset = time.time() - time.monotonic()
+        self._state_cache = {
             "total_touches": self.total_touches,
             "daily_touches": serializable_daily_touches,
-            "touch_timestamps": list(self.touch_timestamps),  # Convert deque to list
+            "touch_timestamps": [ts + wall_offset for ts in self.touch_timestamps],
             "_current_date": self._current_date.isoformat(),
             "_last_touch_status": self._last_touch_status,
         }
+        self._state_dirty = False
+        return self._state_cache
 
     def load_state(self, state_data: Dict) -> None:
         """Load the tracker state from a dictionary."""
@@ -191,20 +242,26 @@ class TouchTracker:
                 for day_str, count in loaded_daily_touches.items()
             }
 
-            # Convert list back to deque
-            self.touch_timestamps = deque(state_data.get("touch_timestamps", []))
+            # Convert saved wall-clock timestamps back to monotonic time
+            wall_offset = time.time() - time.monotonic()
+            self.touch_timestamps = deque(
+                ts - wall_offset for ts in sorted(state_data.get("touch_timestamps", []))
+            )
 
-            # Load current date and last touch status
-            current_date_str = state_data.get("_current_date")
-            if current_date_str:
-                self._current_date = date.fromisoformat(current_date_str)
-            else:
-                self._current_date = date.today()  # Default if not found
+            # The history is pruned against today below, so the saved
+            # "_current_date" only matters for files saved today
+            self._current_date = date.today()
 
-            self._last_touch_status = state_data.get("_last_touch_status", [False] * 12)
+            last_status = state_data.get("_last_touch_status", 0)
+            if isinstance(last_status, list):
+                # Older state files stored a list of booleans
+                last_status = sum(1 << i for i, touched in enumerate(last_status) if touched)
+            self._last_touch_status = last_status
+            self._state_dirty = True
 
             # Prune history based on loaded timestamps and current time
-            self._prune_history(time.time())
+            self._prune_timestamps(time.monotonic())
+            self._prune_daily_touches(self._current_date)
 
             logger.info("TouchTracker state loaded successfully.")
         except Exception as e:
@@ -224,7 +281,6 @@ if __name__ == "__main__":
     tracker = TouchTracker()
 
     try:
-        import asyncio
 
         async def main():
             while True:
@@ -1,33 +1,81 @@
-from typing import List
+from typing import Set, Union
 
 import asyncio
+import contextlib
 from fastapi import WebSocket
 
 
 class ConnectionManager:
     """Manages active WebSocket connections."""
 
+    # Seconds a single client may take to accept a broadcast before it is dropped
+    SEND_TIMEOUT_SEC = 5.0
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         """Accepts a new WebSocket connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        """Removes a WebSocket connection."""
-        self.active_connections.remove(websocket)
-
-    async def send_personal_message(self, message: str, websocket: WebSocket):
-        """Sends a message to a specific WebSocket connection."""
-        await websocket.send_text(message)
-
-    async def broadcast(self, message: str):
-        """Sends a message to all active WebSocket connections."""
-        # Use asyncio.gather for potentially faster broadcasting
-        tasks = [conn.send_text(message) for conn in self.active_connections]
-        await asyncio.gather(*tasks, return_exceptions=True)  # Handle potential errors
+        """Removes a WebSocket connection (no-op if already removed)."""
+        self.active_connections.discard(websocket)
+
+    async def send_personal_message(
+        self, message: Union[str, bytes], websocket: WebSocket
+    ):
+        """Sends a message to a specific WebSocket connection.
+
+        bytes are sent as a binary frame, str as a text frame.
+        """
+        if isinstance(message, bytes):
+            await websocket.send_bytes(message)
+        else:
+            await websocket.send_text(message)
+
+    async def broadcast(self, message: Union[str, bytes]):
+        """Sends a message to all active WebSocket connections.
+
+        bytes are sent as a binary frame, so a single encoded payload is
+        shared by every connection instead of being re-encoded per client.
+        """
+        connections = list(self.active_connections)
+        # Send concurrently, bounding each send so a hung client cannot stall
+        # the whole broadcast
+        tasks = [
+            asyncio.wait_for(
+                self.send_personal_message(message, conn),
+                timeout=self.SEND_TIMEOUT_SEC,
+            )
+            for conn in connections
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Drop connections that failed or timed out so later broadcasts skip them
+        dropped = [
+            conn
+            for conn, result in zip(connections, results)
+            if isinstance(result, Exception)
+        ]
+        for conn in dropped:
+            self.disconnect(conn)
+        if dropped:
+            await asyncio.gather(*(self._close(conn) for conn in dropped))
+
+    async def _close(self, websocket: WebSocket):
+        """Closes a dropped connection so the client notices and reconnects.
+
+        Without this the socket stays open but never receives broadcasts
+        again. The close is bounded like a send, since a stalled client may
+        not accept the close frame either, and errors are ignored since the
+        connection is already broken.
+        """
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(
+                websocket.close(code=1011), timeout=self.SEND_TIMEOUT_SEC
+            )
 
 
 # Global instance (can be imported elsewhere)
@@ -1,12 +1,17 @@
-import json
+import asyncio
+import logging
 from pathlib import Path
+from typing import Optional
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 
 from src.web.connection_manager import manager as stats_manager
 from src.web.connection_manager import ConnectionManager
 
+logger = logging.getLogger("touch_companion.web")
+
 # Create a separate manager for API response websockets
 api_response_manager = ConnectionManager()
 
@@ -17,40 +22,93 @@ INDEX_HTML_FILE = Path(__file__).parent / "templates" / "index.html"
 RESPONSE_HTML_FILE = Path(__file__).parent / "templates" / "response.html"
 
 
+def _stats_message(prefix: bytes, data: dict) -> bytes:
+    """Wrap serialized stats in a pre-encoded message envelope."""
+    return prefix + orjson.dumps(data) + _MESSAGE_SUFFIX
+
+
+def _full_stats_message() -> bytes:
+    """Return the full message for the last broadcast stats, encoding it once."""
+    global _full_message
+    if _full_message is None:
+        _full_message = _stats_message(_FULL_PREFIX, _last_broadcast_stats)
+    return _full_message
+
+
+def _stats_delta(old: dict, new: dict) -> dict:
+    """Return only the stats fields whose values differ from the old ones."""
+    return {key: value for key, value in new.items() if old.get(key) != value}
+
+
+def _read_template(path: Path) -> Optional[bytes]:
+    """Read an HTML template, returning None if it does not exist."""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        logger.error(f"Template not found at {path}")
+        return None
+
+
+# The pages are static, so read them once instead of on every request
+_INDEX_HTML = _read_template(INDEX_HTML_FILE)
+_RESPONSE_HTML = _read_template(RESPONSE_HTML_FILE)
+
+# Stats updates arriving within this window are sent as a single broadcast
+STATS_DEBOUNCE_SEC = 0.1
+
+# Latest stats waiting to be broadcast, and a flag for the broadcaster task
+_pending_stats: Optional[dict] = None
+_stats_pending = asyncio.Event()
+
+# Stats the last delta was computed against
+_last_broadcast_stats: Optional[dict] = None
+
+# Encoded full message for _last_broadcast_stats, shared by every newly
+# connected client
+_full_message: Optional[bytes] = None
+
+# Pre-encoded envelopes for stats messages: {"type": ..., "data": <stats>}
+_FULL_PREFIX = b'{"type":"full","data":'
+_DELTA_PREFIX = b'{"type":"delta","data":'
+_MESSAGE_SUFFIX = b"}"
+
+
 @router.get("/")
 async def get_index():
     """Serves the main HTML page."""
-    try:
-        with open(INDEX_HTML_FILE, "r") as f:
-            html_content = f.read()
-        return HTMLResponse(content=html_content, status_code=200)
-    except FileNotFoundError:
+    if _INDEX_HTML is None:
         return HTMLResponse(
             content="<html><body><h1>Error: index.html not found</h1></body></html>",
             status_code=500,
         )
+    return HTMLResponse(content=_INDEX_HTML, status_code=200)
 
 
 @router.get("/response")
 async def get_response_page():
     """Serves the API response HTML page."""
-    try:
-        with open(RESPONSE_HTML_FILE, "r") as f:
-            html_content = f.read()
-        return HTMLResponse(content=html_content, status_code=200)
-    except FileNotFoundError:
+    if _RESPONSE_HTML is None:
         return HTMLResponse(
             content="<html><body><h1>Error: response.html not found</h1></body></html>",
             status_code=500,
         )
+    return HTMLResponse(content=_RESPONSE_HTML, status_code=200)
 
 
 @router.websocket("/ws/stats")
 async def websocket_stats_endpoint(websocket: WebSocket):
     """Handles WebSocket connections for real-time stats."""
     await stats_manager.connect(websocket)
-    print("WebSocket stats client connected")
+    logger.info("WebSocket stats client connected")
     try:
+        # Broadcasts are deltas against the last broadcast stats, so start the
+        # client off from that same baseline. Until the first broadcast there
+        # is none, and the broadcaster's first full message covers the client.
+        # No await runs between connect() and reading the baseline, so a
+        # broadcast can't slip in between
+        if _last_broadcast_stats is not None:
+            await stats_manager.send_personal_message(_full_stats_message(), websocket)
+
         # Keep the connection alive
         while True:
             # We don't expect messages from the client in this simple case
@@ -58,9 +116,9 @@ async def websocket_stats_endpoint(websocket: WebSocket):
             await websocket.receive_text()  # Or receive_bytes, etc.
     except WebSocketDisconnect:
         stats_manager.disconnect(websocket)
-        print("WebSocket stats client disconnected")
+        logger.info("WebSocket stats client disconnected")
     except Exception as e:
-        print(f"WebSocket Error: {e}")
+        logger.error(f"WebSocket Error: {e}")
         stats_manager.disconnect(websocket)
 
 
@@ -68,7 +126,7 @@ async def websocket_stats_endpoint(websocket: WebSocket):
 async def websocket_api_response_endpoint(websocket: WebSocket):
     """Handles WebSocket connections for API responses."""
     await api_response_manager.connect(websocket)
-    print("WebSocket API response client connected")
+    logger.info("WebSocket API response client connected")
     try:
         # Keep the connection alive
         while True:
@@ -77,17 +135,52 @@ async def websocket_api_response_endpoint(websocket: WebSocket):
             await websocket.receive_text()
     except WebSocketDisconnect:
         api_response_manager.disconnect(websocket)
-        print("WebSocket API response client disconnected")
+        logger.info("WebSocket API response client disconnected")
     except Exception as e:
-        print(f"WebSocket Error: {e}")
+        logger.error(f"WebSocket Error: {e}")
         api_response_manager.disconnect(websocket)
 
 
-async def broadcast_stats(stats: dict):
-    """Broadcasts stats to all connected WebSocket clients."""
-    await stats_manager.broadcast(json.dumps(stats))
+def broadcast_stats(stats: dict):
+    """Schedules stats to be broadcast to all connected WebSocket clients.
+
+    Only the latest stats are kept; stats_broadcaster sends them once per
+    debounce window no matter how often this is called. Stats identical to
+    the last ones are ignored, so an idle device sends nothing.
+    """
+    global _pending_stats
+    if stats == _pending_stats:
+        return
+    _pending_stats = stats
+    _stats_pending.set()
+
+
+async def stats_broadcaster():
+    """Sends pending stats to stats WebSocket clients, coalescing bursts.
+
+    Clients receive a full message on connect, so broadcasts only carry the
+    fields that changed since the previous broadcast.
+    """
+    global _last_broadcast_stats, _full_message
+    while True:
+        await _stats_pending.wait()
+        await asyncio.sleep(STATS_DEBOUNCE_SEC)
+        _stats_pending.clear()
+
+        previous = _last_broadcast_stats
+        # The baseline for deltas and connect messages moves together
+        _last_broadcast_stats = _pending_stats
+        _full_message = None
+        if previous is None:
+            message = _full_stats_message()
+        else:
+            delta = _stats_delta(previous, _last_broadcast_stats)
+            message = _stats_message(_DELTA_PREFIX, delta) if delta else None
+
+        if message and stats_manager.active_connections:
+            await stats_manager.broadcast(message)
 
 
 async def broadcast_api_response(response_data: dict):
     """Broadcasts API response to all connected WebSocket clients."""
-    await api_response_manager.broadcast(json.dumps(response_data))
+    await api_response_manager.broadcast(orjson.dumps(response_data))
@@ -1,6 +1,7 @@
 const responseTextDiv = document.getElementById('response-text');
 const responseContainer = responseTextDiv.parentElement; // Get the parent container
 let socket;
+const textDecoder = new TextDecoder();
 
 // --- Font Size Adjustment --- //
 const MAX_FONT_SIZE = 42; // Initial font size from CSS
@@ -32,6 +33,8 @@ function connectWebSocket() {
 
     console.log(`Connecting to WebSocket: ${wsUrl}`);
     socket = new WebSocket(wsUrl);
+    // The server sends JSON as binary frames
+    socket.binaryType = 'arraybuffer';
 
     socket.onopen = function (event) {
         console.log('WebSocket connection established');
@@ -40,7 +43,8 @@ function connectWebSocket() {
     socket.onmessage = function (event) {
         console.log('Message from server:', event.data);
         try {
-            const data = JSON.parse(event.data);
+            const text = typeof event.data === 'string' ? event.data : textDecoder.decode(event.data);
+            const data = JSON.parse(text);
             updateResponse(data);
         } catch (e) {
             console.error('Error parsing message:', e);
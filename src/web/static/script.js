@@ -3,6 +3,9 @@ const todayCountDiv = document.getElementById('today-count');
 const hourCountDiv = document.getElementById('hour-count');
 
 let socket;
+// Latest full stats; the server sends a full snapshot then only changed fields
+let currentStats = {};
+const textDecoder = new TextDecoder();
 
 function connectWebSocket() {
     // Determine WebSocket protocol based on window location protocol
@@ -11,6 +14,8 @@ function connectWebSocket() {
 
     console.log(`Connecting to WebSocket: ${wsUrl}`);
     socket = new WebSocket(wsUrl);
+    // The server sends JSON as binary frames
+    socket.binaryType = 'arraybuffer';
 
     socket.onopen = function (event) {
         console.log('WebSocket connection established');
@@ -19,8 +24,14 @@ function connectWebSocket() {
     socket.onmessage = function (event) {
         console.log('Message from server:', event.data);
         try {
-            const data = JSON.parse(event.data);
-            updateStatus(data);
+            const text = typeof event.data === 'string' ? event.data : textDecoder.decode(event.data);
+            const message = JSON.parse(text);
+            if (message.type === 'full') {
+                currentStats = message.data;
+            } else if (message.type === 'delta') {
+                Object.assign(currentStats, message.data);
+            }
+            updateStatus(currentStats);
         } catch (e) {
             console.error('Error parsing message:', e);
         }
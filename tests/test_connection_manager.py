@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from src.web.connection_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a WebSocket that records what it is sent."""
+
+    def __init__(self, send_delay=0.0, fail=False):
+        self.send_delay = send_delay
+        self.fail = fail
+        self.received = []
+        self.closed = False
+        self.close_code = None
+
+    async def send_bytes(self, data):
+        await asyncio.sleep(self.send_delay)
+        if self.fail:
+            raise RuntimeError("send failed")
+        self.received.append(data)
+
+    async def send_text(self, data):
+        await self.send_bytes(data)
+
+    async def close(self, code=1000):
+        self.closed = True
+        self.close_code = code
+
+
+@pytest.fixture
+def manager():
+    manager = ConnectionManager()
+    manager.SEND_TIMEOUT_SEC = 0.05
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_broadcast_reaches_all_connections(manager):
+    clients = [FakeWebSocket(), FakeWebSocket()]
+    manager.active_connections.update(clients)
+
+    await manager.broadcast(b"hello")
+
+    for client in clients:
+        assert client.received == [b"hello"]
+        assert not client.closed
+    assert manager.active_connections == set(clients)
+
+
+@pytest.mark.asyncio
+async def test_failed_send_drops_and_closes_connection(manager):
+    healthy = FakeWebSocket()
+    broken = FakeWebSocket(fail=True)
+    manager.active_connections.update([healthy, broken])
+
+    await manager.broadcast(b"hello")
+
+    assert manager.active_connections == {healthy}
+    assert broken.closed
+    assert broken.close_code == 1011
+    assert not healthy.closed
+
+
+@pytest.mark.asyncio
+async def test_timed_out_send_drops_and_closes_connection(manager):
+    healthy = FakeWebSocket()
+    stalled = FakeWebSocket(send_delay=1.0)
+    manager.active_connections.update([healthy, stalled])
+
+    await manager.broadcast(b"hello")
+
+    assert manager.active_connections == {healthy}
+    assert stalled.closed
+    assert stalled.close_code == 1011
+    assert stalled.received == []
+
+    # Later broadcasts only go to the remaining connection
+    await manager.broadcast(b"again")
+    assert healthy.received == [b"hello", b"again"]
+    assert stalled.received == []
+
+
+@pytest.mark.asyncio
+async def test_close_errors_are_ignored(manager):
+    broken = FakeWebSocket(fail=True)
+
+    async def failing_close(code=1000):
+        raise RuntimeError("already closed")
+
+    broken.close = failing_close
+    manager.active_connections.add(broken)
+
+    await manager.broadcast(b"hello")
+
+    assert manager.active_connections == set()
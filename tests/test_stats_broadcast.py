@@ -0,0 +1,132 @@
+import asyncio
+
+import orjson
+import pytest
+from fastapi import WebSocketDisconnect
+
+from src.web import routes
+from src.web.connection_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """Stats client stand-in that applies messages like script.js does."""
+
+    def __init__(self):
+        self.stats = {}
+        self.messages = []
+        self._closed = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def receive_text(self):
+        await self._closed.wait()
+        raise WebSocketDisconnect()
+
+    async def send_bytes(self, data):
+        message = orjson.loads(data)
+        self.messages.append(message)
+        if message["type"] == "full":
+            self.stats = dict(message["data"])
+        else:
+            self.stats.update(message["data"])
+
+    async def close(self, code=1000):
+        self._closed.set()
+
+
+@pytest.fixture
+def stats_routes(monkeypatch):
+    """Fresh broadcast state, a short debounce and a running broadcaster."""
+    monkeypatch.setattr(routes, "STATS_DEBOUNCE_SEC", 0.01)
+    monkeypatch.setattr(routes, "stats_manager", ConnectionManager())
+    monkeypatch.setattr(routes, "_stats_pending", asyncio.Event())
+    monkeypatch.setattr(routes, "_pending_stats", None)
+    monkeypatch.setattr(routes, "_last_broadcast_stats", None)
+    monkeypatch.setattr(routes, "_full_message", None)
+    return routes
+
+
+async def _settle():
+    """Wait until the broadcaster has flushed anything pending."""
+    await asyncio.sleep(routes.STATS_DEBOUNCE_SEC * 5)
+
+
+async def _connect(client):
+    task = asyncio.create_task(routes.websocket_stats_endpoint(client))
+    await asyncio.sleep(0)
+    return task
+
+
+@pytest.mark.asyncio
+async def test_client_receives_full_then_deltas(stats_routes):
+    broadcaster = asyncio.create_task(routes.stats_broadcaster())
+    client = FakeWebSocket()
+    endpoint = await _connect(client)
+    try:
+        routes.broadcast_stats({"hour": 1, "total": 1})
+        await _settle()
+        routes.broadcast_stats({"hour": 1, "total": 2})
+        await _settle()
+
+        assert client.messages == [
+            {"type": "full", "data": {"hour": 1, "total": 1}},
+            {"type": "delta", "data": {"total": 2}},
+        ]
+        assert client.stats == {"hour": 1, "total": 2}
+    finally:
+        await client.close()
+        broadcaster.cancel()
+        await asyncio.gather(broadcaster, endpoint, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_client_connecting_mid_debounce_stays_in_sync(stats_routes):
+    broadcaster = asyncio.create_task(routes.stats_broadcaster())
+    client = FakeWebSocket()
+    endpoint = None
+    try:
+        # A is broadcast, then B is pending when the client connects
+        routes.broadcast_stats({"hour": 5, "total": 1})
+        await _settle()
+        routes.broadcast_stats({"hour": 6, "total": 2})
+        endpoint = await _connect(client)
+
+        # C reverts "hour" to A's value before the debounced broadcast runs
+        routes.broadcast_stats({"hour": 5, "total": 3})
+        await _settle()
+
+        assert client.stats == {"hour": 5, "total": 3}
+    finally:
+        await client.close()
+        broadcaster.cancel()
+        await asyncio.gather(
+            *(task for task in (broadcaster, endpoint) if task),
+            return_exceptions=True,
+        )
+
+
+@pytest.mark.asyncio
+async def test_connect_message_follows_last_broadcast(stats_routes):
+    broadcaster = asyncio.create_task(routes.stats_broadcaster())
+    client = FakeWebSocket()
+    endpoint = None
+    try:
+        routes.broadcast_stats({"hour": 1, "total": 1})
+        await _settle()
+        routes.broadcast_stats({"hour": 2, "total": 2})
+        await _settle()
+        # Pending but not yet broadcast, so not part of the connect message
+        routes.broadcast_stats({"hour": 3, "total": 3})
+        endpoint = await _connect(client)
+
+        assert client.messages == [{"type": "full", "data": {"hour": 2, "total": 2}}]
+        await _settle()
+        assert client.stats == {"hour": 3, "total": 3}
+    finally:
+        await client.close()
+        broadcaster.cancel()
+        await asyncio.gather(
+            *(task for task in (broadcaster, endpoint) if task),
+            return_exceptions=True,
+        )